@@ -0,0 +1,163 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import streamlit as st
+
+from src.interface.classes.auth_manager import AuthManager
+
+# --- Logging Configuration ---
+logger = logging.getLogger("TwinSight-AppState")
+
+# Default state payloads, built once at import; copied on seed because
+# callers mutate their own session copy
+_DEFAULT_FILTERS = {
+    "date_range": None,
+    "asset_type": [],
+    "status": []
+}
+_DEFAULT_SIM_CONFIG = {
+    "asset_count": 5,
+    "duration_days": 180,
+    "interval_minutes": 60,
+    "seed": 42
+}
+
+
+@dataclass(slots=True)
+class _AppView:
+    """
+    In-memory snapshot of the namespaced session state. Property reads hit
+    these fixed slots instead of hashing into st.session_state on every
+    access; writes go through the TwinSightApp setters, which keep
+    session_state and the URL in sync.
+    """
+    context: str
+    selected_asset_id: Optional[str]
+    filters: dict
+    sim_config: dict
+
+
+class TwinSightApp:
+    """
+    Central state holder for the Streamlit interface.
+
+    Wraps st.session_state behind namespaced keys (prefix 'ts_') and keeps
+    the URL query params in sync, so views can be bookmarked and shared.
+    """
+
+    # State keys managed through _get_state/_set_state
+    _STATE_KEYS = ("view", "asset_id", "filters", "sim_config")
+
+    def __init__(self, is_standalone: bool = False, prefix: str = "ts_"):
+        self.prefix = prefix
+        self.is_standalone = is_standalone
+        self.auth = AuthManager(prefix=prefix)
+        # Precomputed namespaced keys: _get_state/_set_state sit on the hot
+        # rerun path, so avoid rebuilding the f-string on every access
+        self._keys = {key: f"{prefix}{key}" for key in self._STATE_KEYS}
+        self._init_state()
+        self._view = _AppView(
+            context=self._get_state("view", "dashboard"),
+            selected_asset_id=self._get_state("asset_id"),
+            filters=self._get_state("filters", {}),
+            sim_config=self._get_state("sim_config", {})
+        )
+
+    # --- Session state helpers ---
+
+    def _get_state(self, key: str, default: Any = None) -> Any:
+        return st.session_state.get(self._keys[key], default)
+
+    def _set_state(self, key: str, value: Any) -> None:
+        full_key = self._keys[key]
+        # Idempotent: rewriting an unchanged value just burns a dispatch
+        if st.session_state.get(full_key) == value:
+            return
+        st.session_state[full_key] = value
+
+    def _sync_url(self, key: str, value: Optional[Any]) -> None:
+        """Mirrors a state value into the URL query params (drops falsy values)."""
+        current = st.query_params.get(key)
+        if value:
+            # Each query-param assignment triggers a browser URL update,
+            # so skip it entirely when the value is already in place
+            if current != str(value):
+                st.query_params[key] = str(value)
+        elif current is not None:
+            del st.query_params[key]
+
+    def _sync_url_many(self, pairs: dict) -> None:
+        """
+        Mirrors several state values into the URL in one pass, touching
+        only the keys it is handed. Each key is diffed first — per-key
+        assignments push a browser history entry (and can race with
+        st.rerun) — and params the app doesn't manage (e.g. ?debug=1)
+        are left untouched.
+        """
+        for key, value in pairs.items():
+            self._sync_url(key, value)
+
+    def _init_state(self) -> None:
+        """Seeds session state, restoring view/asset selection from the URL."""
+        view = st.query_params.get("view") or self._get_state("view") or "dashboard"
+        self._set_state("view", view)
+
+        asset_id = st.query_params.get("asset_id") or self._get_state("asset_id")
+        self._set_state("asset_id", asset_id)
+
+        self._sync_url_many({"view": view, "asset_id": asset_id})
+
+        # setdefault writes only when the key is missing, replacing the
+        # previous get-then-set round-trip through the prefix helpers
+        st.session_state.setdefault(self._keys["filters"], dict(_DEFAULT_FILTERS))
+        sim_config = st.session_state.setdefault(
+            self._keys["sim_config"], dict(_DEFAULT_SIM_CONFIG)
+        )
+
+        # Concrete widget keys for the simulation form: binding widgets via
+        # key= lets them sync with session_state directly, with no per-rerun
+        # config.get() default reconciliation in the render function
+        for field, default in sim_config.items():
+            st.session_state.setdefault(f"{self.prefix}sim_{field}", default)
+
+    # --- Public state accessors ---
+
+    @property
+    def context(self) -> str:
+        """Currently selected view ('dashboard', 'simulation' or 'settings')."""
+        return self._view.context
+
+    @context.setter
+    def context(self, value: str) -> None:
+        self._view.context = value
+        self._set_state("view", value)
+        self._sync_url_many({"view": value, "asset_id": self._view.selected_asset_id})
+
+    @property
+    def selected_asset_id(self) -> Optional[str]:
+        return self._view.selected_asset_id
+
+    @selected_asset_id.setter
+    def selected_asset_id(self, value: Optional[str]) -> None:
+        self._view.selected_asset_id = value
+        self._set_state("asset_id", value)
+        self._sync_url_many({"view": self._view.context, "asset_id": value})
+
+    @property
+    def filters(self) -> dict:
+        return self._view.filters
+
+    @filters.setter
+    def filters(self, value: dict) -> None:
+        self._view.filters = value
+        self._set_state("filters", value)
+
+    @property
+    def simulation_config(self) -> dict:
+        return self._view.sim_config
+
+    @simulation_config.setter
+    def simulation_config(self, value: dict) -> None:
+        self._view.sim_config = value
+        self._set_state("sim_config", value)
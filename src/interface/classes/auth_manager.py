@@ -0,0 +1,148 @@
+import logging
+import types
+from typing import Optional, Tuple
+
+import streamlit as st
+from openai import OpenAI, APIConnectionError, AuthenticationError, NotFoundError
+
+from src.utils.env import load_config, update_env_variable
+
+# --- Logging Configuration ---
+logger = logging.getLogger("TwinSight-Auth")
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_load_config() -> dict:
+    """
+    Parses the .env file once per server process. AuthManager is rebuilt on
+    every Streamlit rerun, so an uncached load_config() would re-read and
+    re-parse the file from disk on each interaction.
+    """
+    return load_config()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_openai_client(url: Optional[str], key: Optional[str]) -> OpenAI:
+    """
+    Returns a shared OpenAI client for (url, key). Building a client sets up
+    an httpx pool and TLS context, so reusing one keeps connections alive
+    across reruns instead of re-handshaking on every validation.
+    """
+    return OpenAI(base_url=url, api_key=key)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _probe_openai(url: Optional[str], key: Optional[str], model: Optional[str]) -> Tuple[bool, str]:
+    """
+    Performs the live credential check against the configured endpoint.
+    Cached per (url, key, model) so repeated Settings reruns don't pay
+    a full HTTPS round-trip while the credentials are unchanged.
+    """
+    try:
+        client = _get_openai_client(url, key)
+        # A metadata lookup is enough to distinguish bad key / bad model /
+        # unreachable endpoint, without paying for a completion round-trip
+        client.models.retrieve(model)
+        return True, "Connection successful."
+
+    except AuthenticationError:
+        return False, "Authentication failed. Check your API key."
+    except NotFoundError:
+        return False, f"Model '{model}' not found on this endpoint."
+    except APIConnectionError:
+        return False, "Could not reach the API endpoint. Check the URL."
+    except Exception as e:
+        return False, f"Validation error: {e}"
+
+
+class AuthManager:
+    """
+    Resolves API credentials for the interface and validates them against
+    the configured OpenAI-compatible endpoint.
+
+    Precedence for every credential: st.session_state override (set via
+    the Settings page) > .env config > fallback.
+    """
+
+    # Frozen model_type -> resolved-credential key mapping, allocated once
+    # at class creation instead of as a dict literal per get_model call
+    _MODEL_KEY_MAP = types.MappingProxyType({
+        "text": "model_text",
+        "json": "model_json",
+        "validation": "model_validation"
+    })
+
+    def __init__(self, prefix: str = "ts_"):
+        self.prefix = prefix
+        self.config = _cached_load_config()
+        # Precomputed session keys: the precedence lookups run on every rerun
+        self._sk_api_key = f"{prefix}api_key"
+        self._sk_api_url = f"{prefix}api_url"
+        self._sk_models = {t: f"{prefix}model_{t}" for t in ("text", "json", "validation")}
+        # Resolved credentials are cached until set_credentials bumps the generation
+        self._creds_gen = 0
+        self._resolved: Optional[dict] = None
+        self._resolved_gen = -1
+
+    def _resolve(self) -> dict:
+        """
+        Computes the full credential set (session override > .env config)
+        in a single pass. Cached per credential generation so the sidebar,
+        validation and AI calls within one rerun share the same lookup.
+        """
+        if self._resolved is None or self._resolved_gen != self._creds_gen:
+            ss = st.session_state
+            cfg = self.config
+            model_text = ss.get(self._sk_models["text"]) or cfg.get("MODEL_FOR_TEXT")
+            self._resolved = {
+                "api_key": ss.get(self._sk_api_key) or cfg.get("API_KEY"),
+                "api_url": ss.get(self._sk_api_url) or cfg.get("API_URL"),
+                "model_text": model_text,
+                # json/validation models are optional; fall back to the text model
+                "model_json": ss.get(self._sk_models["json"]) or cfg.get("MODEL_FOR_JSON") or model_text,
+                "model_validation": ss.get(self._sk_models["validation"]) or cfg.get("VALIDATION_MODEL") or model_text
+            }
+            self._resolved_gen = self._creds_gen
+        return self._resolved
+
+    def get_api_key(self) -> Optional[str]:
+        return self._resolve()["api_key"]
+
+    def get_api_url(self) -> Optional[str]:
+        return self._resolve()["api_url"]
+
+    def get_model(self, model_type: str = "text") -> Optional[str]:
+        """Returns the configured model for 'text', 'json' or 'validation'."""
+        return self._resolve()[self._MODEL_KEY_MAP.get(model_type, "model_text")]
+
+    def set_credentials(self, api_key: Optional[str] = None, api_url: Optional[str] = None,
+                        persist: bool = False) -> None:
+        """Overrides credentials for the current session, optionally writing them to .env."""
+        if api_key is not None:
+            st.session_state[self._sk_api_key] = api_key
+        if api_url is not None:
+            st.session_state[self._sk_api_url] = api_url
+
+        if persist:
+            if api_key is not None:
+                update_env_variable("API_KEY", api_key)
+            if api_url is not None:
+                update_env_variable("API_URL", api_url)
+            # .env changed on disk: drop the memoized parse and reload
+            _cached_load_config.clear()
+            self.config = _cached_load_config()
+
+        # Credentials changed: cached probe results and pooled connections
+        # built with the old credentials are no longer valid
+        _probe_openai.clear()
+        _get_openai_client.clear()
+        self._creds_gen += 1
+        logger.info("Credentials updated (persist=%s).", persist)
+
+    def validate_connection(self) -> Tuple[bool, str]:
+        """Checks that the configured endpoint accepts our credentials."""
+        key = self.get_api_key()
+        if not key:
+            return False, "No API key configured."
+
+        return _probe_openai(self.get_api_url(), key, self.get_model("validation"))
@@ -0,0 +1,111 @@
+import os
+import sys
+import logging
+from functools import cache
+
+# Guarded so repeated imports (pytest, hot reload) don't grow sys.path,
+# which would slow every downstream import search
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import streamlit as st
+
+from src.interface.classes.app_state import TwinSightApp
+
+# --- Logging Configuration ---
+logger = logging.getLogger("TwinSight-Interface")
+
+# Sidebar label -> internal view name
+_NAV_VIEWS = {
+    "Monitoring": "dashboard",
+    "Simulation": "simulation",
+    "Settings": "settings"
+}
+_VIEW_INDEX = {view: i for i, view in enumerate(_NAV_VIEWS.values())}
+
+# Static stylesheet, built once at import time. Only the sidebar width
+# remains here — theming and toolbar hiding moved to .streamlit/config.toml,
+# which the client applies natively without an HTML injection
+_CSS = """
+<style>
+[data-testid="stSidebar"] { min-width: 280px; max-width: 280px; }
+</style>
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _logo_path_or_none():
+    """
+    Stats the logo asset once per server process. Its presence doesn't
+    change at runtime, so there is no reason to re-check on every rerun.
+    """
+    path = "src/interface/assets/logo.png"
+    return path if os.path.exists(path) else None
+
+
+@cache
+def _resolve_view(context: str):
+    """
+    Returns the render callable for a view, importing its module on first
+    use only. Each rerun renders a single view, so importing all three
+    (and their transitive pandas/plotly deps) at startup is wasted work.
+    """
+    if context == "settings":
+        from src.interface.modules.settings import render_settings
+        return render_settings
+    if context == "simulation":
+        from src.interface.modules.simulation import render_simulation
+        return render_simulation
+    from src.interface.modules.dashboard import render_dashboard
+    return render_dashboard
+
+
+def main():
+    st.set_page_config(page_title="TwinSight AI", page_icon="⚙️", layout="wide")
+
+    # Rendered every rerun: Streamlit drops elements that aren't re-created,
+    # so a one-shot injection would lose the styling on the next interaction.
+    # The block is a ~90-byte module constant, so re-sending it is free.
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+    # The app object is a per-session singleton: constructing it runs
+    # AuthManager init + state seeding, which must not repeat on every rerun.
+    if "_ts_app" not in st.session_state:
+        st.session_state["_ts_app"] = TwinSightApp(is_standalone=True)
+    app = st.session_state["_ts_app"]
+
+    with st.sidebar:
+        logo = _logo_path_or_none()
+        if logo:
+            st.logo(logo)
+        else:
+            st.title("TwinSight")
+
+        # A radio already triggers exactly one rerun on change; the previous
+        # per-button `app.context = ...; st.rerun()` pattern cost a second
+        # rerun per navigation and raced with the query-param sync.
+        selection = st.radio(
+            "Navigation",
+            list(_NAV_VIEWS),
+            index=_VIEW_INDEX.get(app.context, 0),
+            label_visibility="collapsed"
+        )
+        app.context = _NAV_VIEWS[selection]
+
+        # The debug block serializes state (including a credential lookup)
+        # and ships it over the websocket on every rerun, so it only renders
+        # when explicitly enabled via ?debug=1 or the ts_debug flag
+        if st.session_state.get("ts_debug", False) or st.query_params.get("debug") == "1":
+            with st.expander("Debug State"):
+                st.json({
+                    "view": app.context,
+                    "asset_id": app.selected_asset_id,
+                    "API Key": "Set" if app.auth.get_api_key() else "Missing"
+                })
+
+    _resolve_view(app.context)(app)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import logging
+
+import streamlit as st
+
+from src.modules.data.data_manager import DataManager
+
+# --- Logging Configuration ---
+logger = logging.getLogger("TwinSight-Dashboard")
+
+
+@st.cache_resource(show_spinner=False)
+def _get_data_manager() -> DataManager:
+    """
+    One DataManager per server process. Rebuilding it per rerun reopened
+    the read-only connection and started every render with cold mtime
+    caches — the caches only pay off if the instance outlives the rerun.
+    """
+    return DataManager("sensors.db")
+
+
+def render_dashboard(app) -> None:
+    """Monitoring view: fleet KPIs and the latest reading per asset."""
+    st.header("Fleet Monitoring")
+
+    dm = _get_data_manager()
+    snapshot = dm.get_fleet_snapshot()
+
+    if snapshot.empty:
+        st.info("No telemetry found. Run the simulation to generate data.")
+        return
+
+    kpis = dm.get_kpi_summary(snapshot)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Assets", kpis["total_assets"])
+    col2.metric("Healthy", kpis["healthy"])
+    col3.metric("Warning", kpis["warning"])
+    col4.metric("Critical", kpis["critical"])
+    st.caption(f"Average fleet health: {kpis['avg_health']}%")
+
+    st.dataframe(snapshot, use_container_width=True)
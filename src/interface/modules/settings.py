@@ -0,0 +1,28 @@
+import logging
+
+import streamlit as st
+
+# --- Logging Configuration ---
+logger = logging.getLogger("TwinSight-Settings")
+
+
+def render_settings(app) -> None:
+    """Settings view: credential management and connection validation."""
+    st.header("Settings")
+
+    with st.form("credentials"):
+        api_url = st.text_input("API URL", value=app.auth.get_api_url() or "")
+        api_key = st.text_input("API Key", value=app.auth.get_api_key() or "", type="password")
+        persist = st.checkbox("Persist to .env", value=False)
+        submitted = st.form_submit_button("Save")
+
+    if submitted:
+        app.auth.set_credentials(api_key=api_key or None, api_url=api_url or None, persist=persist)
+        st.success("Credentials updated.")
+
+    if st.button("Test Connection"):
+        ok, message = app.auth.validate_connection()
+        if ok:
+            st.success(message)
+        else:
+            st.error(message)
@@ -0,0 +1,36 @@
+import logging
+
+import streamlit as st
+
+# --- Logging Configuration ---
+logger = logging.getLogger("TwinSight-Simulation")
+
+
+def render_simulation(app) -> None:
+    """Simulation view: configure the synthetic fleet generation parameters."""
+    st.header("Simulation")
+
+    # Widgets are bound straight to session_state (seeded in _init_state),
+    # so no value=config.get(...) reconciliation runs on reruns
+    with st.form("sim_config"):
+        st.number_input("Number of assets", min_value=1, max_value=500,
+                        key=f"{app.prefix}sim_asset_count")
+        st.number_input("Duration (days)", min_value=1, max_value=730,
+                        key=f"{app.prefix}sim_duration_days")
+        st.number_input("Sampling interval (minutes)", min_value=1, max_value=1440,
+                        key=f"{app.prefix}sim_interval_minutes")
+        st.number_input("Random seed", min_value=0,
+                        key=f"{app.prefix}sim_seed")
+        submitted = st.form_submit_button("Save configuration")
+
+    if submitted:
+        state = st.session_state
+        app.simulation_config = {
+            "asset_count": int(state[f"{app.prefix}sim_asset_count"]),
+            "duration_days": int(state[f"{app.prefix}sim_duration_days"]),
+            "interval_minutes": int(state[f"{app.prefix}sim_interval_minutes"]),
+            "seed": int(state[f"{app.prefix}sim_seed"])
+        }
+        st.success("Simulation configuration saved.")
+
+    st.caption("Run `python -m src.main` to generate telemetry with these settings.")
@@ -1,4 +1,4 @@
-import time
+import asyncio
 import logging
 
 from src.modules.data.database_handler import DatabaseHandler
@@ -12,6 +12,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger("TwinSight-Orchestrator")
 
+
+async def _asset_loop(asset, queue: asyncio.Queue, cycles: int,
+                      interval_s: float = 0.5) -> None:
+    """
+    Drives one asset: polls telemetry each cycle and hands the packet to
+    the writer queue. await-based sleeping lets every asset tick on its
+    own schedule instead of serializing behind one blocking loop.
+    """
+    for _ in range(cycles):
+        queue.put_nowait(asset.get_telemetry())
+        await asyncio.sleep(interval_s)
+
+
+async def _writer_loop(db: DatabaseHandler, queue: asyncio.Queue) -> None:
+    """
+    Single writer: drains the queue and persists each drained batch in
+    one save_readings_bulk call, pushed to a worker thread so the event
+    loop never blocks on SQLite. A None packet shuts the writer down.
+    """
+    pending = []
+    while True:
+        packet = await queue.get()
+        if packet is not None:
+            pending.append(packet)
+            # Batch whatever arrived behind it in the same flush
+            while not queue.empty():
+                extra = queue.get_nowait()
+                if extra is None:
+                    packet = None
+                    break
+                pending.append(extra)
+        if pending:
+            await asyncio.to_thread(db.save_readings_bulk, pending)
+            pending = []
+        if packet is None:
+            return
+
+
+async def _run_assets(db: DatabaseHandler, assets: list, cycles: int) -> None:
+    """Runs all asset loops concurrently against one writer task."""
+    queue: asyncio.Queue = asyncio.Queue()
+    writer = asyncio.create_task(_writer_loop(db, queue))
+    await asyncio.gather(*(_asset_loop(asset, queue, cycles) for asset in assets))
+    queue.put_nowait(None)
+    await writer
+
+
 def run_simulation():
     """
     Orchestrates the simulation of multiple industrial assets 
@@ -47,19 +94,12 @@ def run_simulation():
             asset.start()
 
         # 4. Simulation Loop (Generate & Ingest)
+        # Event-driven: one coroutine per asset feeds a queue consumed by
+        # a single batching writer, so adding assets doesn't stretch the
+        # cycle time the way the old sequential sleep loop did
         cycles_to_run = 10
         logger.info(f"Running simulation for {cycles_to_run} cycles...")
-
-        for i in range(cycles_to_run):
-            for asset in assets:
-                # Generate Telemetry (Physics Calculation)
-                telemetry_packet = asset.get_telemetry()
-                
-                # Persist to Database
-                db.save_reading(telemetry_packet)
-            
-            # Simulate sampling rate
-            time.sleep(0.5)
+        asyncio.run(_run_assets(db, assets, cycles_to_run))
 
         # 5. Stop Sequence
         logger.info("Stopping production line...")
@@ -73,7 +113,7 @@ def run_simulation():
         logger.info("="*60)
         
         # Header formatting
-        header = f"{'ID':<5} | {'TIMESTAMP':<20} | {'MOTOR_ID':<15} | {'RPM':<6} | {'TEMP':<6}"
+        header = f"{'TIMESTAMP':<20} | {'MOTOR_ID':<15} | {'RPM':<6} | {'TEMP':<6}"
         logger.info(header)
         logger.info("-" * len(header))
 
@@ -81,14 +121,14 @@ def run_simulation():
         
         # Display formatted rows via Logger
         for row in rows:
-            # Unpacking based on DB Schema:
-            # (id, motor_id, timestamp, status, load_pct, speed_rpm, temperature_c, vibration_mm_s, degradation_level)
-            r_id, r_motor, r_time, _, _, r_speed, r_temp, _, _ = row
-            
+            # Unpacking based on the explicit column list:
+            # (motor_id, timestamp, status, load_pct, speed_rpm, temperature_c, vibration_mm_s, degradation_level)
+            r_motor, r_time, _, _, r_speed, r_temp, _, _ = row
+
             # Extract time only (HH:MM:SS) from ISO format for cleaner log
             time_str = r_time[11:19] if len(r_time) > 19 else r_time
-            
-            logger.info(f"{r_id:<5} | {time_str:<20} | {r_motor:<15} | {r_speed:<6} | {r_temp:<6.1f}")
+
+            logger.info(f"{time_str:<20} | {r_motor:<15} | {r_speed:<6} | {r_temp:<6.1f}")
 
     except KeyboardInterrupt:
         logger.warning("Simulation stopped by user.")
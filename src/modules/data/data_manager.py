@@ -0,0 +1,247 @@
+import os
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# --- Logging Configuration ---
+logger = logging.getLogger("TwinSight-DataManager")
+
+# Statuses rolled up into the "critical" KPI bucket. Hoisted to module
+# scope so the membership set is built once, not per summary call.
+_CRITICAL_STATES = frozenset({"CRITICAL", "MAINTENANCE"})
+
+
+class DataManager:
+    """
+    Read-side access layer for the telemetry database.
+    Returns pandas DataFrames shaped for the dashboard views, leaving the
+    write path to DatabaseHandler.
+    """
+
+    def __init__(self, db_name: str = "sensors.db"):
+        # Same path convention as DatabaseHandler so both sides of the
+        # pipeline agree on where the database lives
+        self.project_root = os.getcwd()
+        self.db_path = os.path.join(self.project_root, "src", "modules", "data", db_name)
+        self._conn: Optional[sqlite3.Connection] = None
+        # Query results keyed on the DB file mtime: dashboard renders call
+        # the same reads for several widgets, and a cheap os.stat decides
+        # whether the previous result is still current
+        self._snap_cache: Optional[tuple] = None
+        self._hist_cache: dict = {}
+        self._hist_cache_mtime: Optional[float] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Returns the shared read-only connection, opened lazily on first
+        use. Reconnecting per query re-paid URI parsing, pragma setup and
+        a cold page cache on every dashboard poll; a single mmap-backed
+        read-only connection amortizes all of that and coexists with
+        DatabaseHandler's WAL writes.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            conn.execute("PRAGMA query_only=ON;")
+            conn.execute("PRAGMA mmap_size=268435456;")
+            conn.execute("PRAGMA cache_size=-65536;")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self):
+        self.close()
+
+    def _db_mtime(self) -> Optional[tuple]:
+        # In WAL mode commits land in the -wal file first, so the main DB
+        # file's mtime alone would miss fresh writes
+        try:
+            mtime = os.path.getmtime(self.db_path)
+        except OSError:
+            return None
+        try:
+            wal_mtime = os.path.getmtime(self.db_path + "-wal")
+        except OSError:
+            wal_mtime = 0.0
+        return (mtime, wal_mtime)
+
+    def get_fleet_snapshot(self) -> pd.DataFrame:
+        """Returns the most recent telemetry row for every motor in the fleet."""
+        mtime = self._db_mtime()
+        if self._snap_cache is not None and self._snap_cache[0] == mtime:
+            return self._snap_cache[1]
+
+        # ROW_NUMBER over (motor_id, timestamp DESC) resolves "latest row
+        # per motor" in a single indexed scan; the previous GROUP BY
+        # subquery + self-join read the table twice
+        query = """
+        SELECT motor_id, timestamp, status, load_pct, speed_rpm,
+               temperature_c, vibration_mm_s, degradation_level
+        FROM (
+            SELECT *, ROW_NUMBER() OVER (
+                PARTITION BY motor_id ORDER BY timestamp DESC, id DESC
+            ) AS rn
+            FROM telemetry
+        )
+        WHERE rn = 1
+        ORDER BY motor_id;
+        """
+        try:
+            df = pd.read_sql_query(query, self._get_connection())
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
+            logger.error(f"Error reading fleet snapshot: {e}")
+            return pd.DataFrame()
+
+        if df.empty:
+            return df
+
+        # SQLite hands everything back as float64/int64/object; none of
+        # these columns need 8 bytes. Narrower floats halve the bandwidth
+        # of downstream reductions, and category codes turn the KPI
+        # value_counts into an integer bucket count instead of string
+        # hashing.
+        df = df.astype({
+            "motor_id": "category",
+            "status": "category",
+            "load_pct": "float32",
+            "speed_rpm": "int16",
+            "temperature_c": "float32",
+            "vibration_mm_s": "float32",
+            "degradation_level": "float32"
+        })
+
+        # Derive the asset type from the ID suffix (e.g. MTR-01-CONVEYOR).
+        # The .str accessor runs as a single vectorized pass over the column
+        # instead of a Python lambda per row.
+        df["asset_type"] = df["motor_id"].str.rsplit("-", n=1).str[-1].fillna("GENERIC")
+
+        self._snap_cache = (mtime, df)
+        return df
+
+    def get_asset_history(self, motor_id: str, days: int = 7) -> pd.DataFrame:
+        """Fetches the telemetry trail for one motor over the last N days."""
+        # The cutoff is computed in Python and bound as a plain literal:
+        # with both sides of the comparison constant, the planner runs a
+        # clean range scan on the (motor_id, timestamp) index instead of
+        # evaluating datetime('now', ?) inside the query
+        query = """
+        SELECT timestamp, status, load_pct, speed_rpm,
+               temperature_c, vibration_mm_s, degradation_level
+        FROM telemetry
+        WHERE motor_id = ? AND timestamp >= ?
+        ORDER BY timestamp ASC;
+        """
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat(timespec="seconds")
+        mtime = self._db_mtime()
+        if mtime != self._hist_cache_mtime:
+            self._hist_cache.clear()
+            self._hist_cache_mtime = mtime
+        cache_key = (motor_id, days)
+        if cache_key in self._hist_cache:
+            return self._hist_cache[cache_key]
+
+        try:
+            cursor = self._get_connection().execute(query, (motor_id, cutoff))
+            rows = cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading history for {motor_id}: {e}")
+            return pd.DataFrame()
+
+        if not rows:
+            return pd.DataFrame()
+
+        # Build typed columns directly instead of going through
+        # pd.read_sql_query, whose row-by-row walk boxes every value and
+        # runs a full dtype-inference pass. float32 is plenty for sensor
+        # readings and halves the memory the charts have to chew through.
+        n = len(rows)
+        ts, status, load, rpm, temp, vib, deg = zip(*rows)
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(np.asarray(ts)),
+            "status": status,
+            "load_pct": np.fromiter(load, dtype=np.float32, count=n),
+            "speed_rpm": np.fromiter(rpm, dtype=np.int32, count=n),
+            "temperature_c": np.fromiter(temp, dtype=np.float32, count=n),
+            "vibration_mm_s": np.fromiter(vib, dtype=np.float32, count=n),
+            "degradation_level": np.fromiter(deg, dtype=np.float32, count=n)
+        })
+        self._hist_cache[cache_key] = df
+        return df
+
+    _EMPTY_KPIS = {
+        "total_assets": 0,
+        "healthy": 0,
+        "warning": 0,
+        "critical": 0,
+        "avg_health": 100.0
+    }
+
+    def get_kpi_summary(self, df_snapshot: Optional[pd.DataFrame] = None) -> dict:
+        """
+        Aggregates the latest fleet state into the dashboard KPI cards.
+        Callers that already hold the snapshot can pass it in to reuse it;
+        otherwise the aggregation runs entirely in SQL, moving a handful of
+        (status, count, avg) rows across the SQLite boundary instead of the
+        whole snapshot.
+        """
+        if df_snapshot is None:
+            return self._get_kpi_summary_sql()
+
+        if df_snapshot.empty:
+            return dict(self._EMPTY_KPIS)
+
+        # One pass over the status column replaces the previous per-bucket
+        # boolean masks (each of which scanned the column and materialized
+        # a throwaway sub-frame)
+        counts = df_snapshot["status"].value_counts()
+
+        return {
+            "total_assets": len(df_snapshot),
+            "healthy": int(counts.get("NORMAL", 0)),
+            "warning": int(counts.get("WARNING", 0)),
+            "critical": int(sum(counts.get(s, 0) for s in _CRITICAL_STATES)),
+            "avg_health": round(100 - float(df_snapshot["degradation_level"].values.mean()), 1)
+        }
+
+    def _get_kpi_summary_sql(self) -> dict:
+        """Computes the KPI buckets inside SQLite over the latest-per-motor rows."""
+        query = """
+        WITH latest AS (
+            SELECT status, degradation_level,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY motor_id ORDER BY timestamp DESC, id DESC
+                   ) AS rn
+            FROM telemetry
+        )
+        SELECT status, COUNT(*) AS n, AVG(degradation_level) AS avg_deg
+        FROM latest WHERE rn = 1 GROUP BY status;
+        """
+        try:
+            rows = self._get_connection().execute(query).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error aggregating KPIs: {e}")
+            return dict(self._EMPTY_KPIS)
+
+        if not rows:
+            return dict(self._EMPTY_KPIS)
+
+        counts = {status: n for status, n, _ in rows}
+        total = sum(counts.values())
+        avg_degradation = sum(n * avg_deg for _, n, avg_deg in rows) / total
+
+        return {
+            "total_assets": total,
+            "healthy": counts.get("NORMAL", 0),
+            "warning": counts.get("WARNING", 0),
+            "critical": sum(counts.get(s, 0) for s in _CRITICAL_STATES),
+            "avg_health": round(100 - avg_degradation, 1)
+        }
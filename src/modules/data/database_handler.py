@@ -1,18 +1,43 @@
 import sqlite3
 import logging
 import os
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
 
 # --- Logging Configuration ---
 #logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("TwinSight-DB")
 
+# Telemetry columns in INSERT order; the itemgetter builds the parameter
+# tuple in one C call instead of eight sequential dict lookups per row
+_COLUMNS = (
+    "motor_id", "timestamp", "status", "load_pct",
+    "speed_rpm", "temperature_c", "vibration_mm_s", "degradation_level"
+)
+_ROW_GETTER = itemgetter(*_COLUMNS)
+
+
+def _as_row(data: Any) -> tuple:
+    # Telemetry NamedTuples are already plain tuples in column order;
+    # dicts go through the itemgetter
+    return data if isinstance(data, tuple) else _ROW_GETTER(data)
+
 class DatabaseHandler:
     """
     Handles SQLite database operations for the TwinSight-AI project.
     Thread-safe and robust handling of paths and connections.
     """
 
+    # One INSERT text shared by both save paths: identical SQL means the
+    # driver's statement cache reuses a single prepared statement instead
+    # of re-preparing near-duplicate strings
+    _INSERT_SQL = """
+    INSERT INTO telemetry (
+        motor_id, timestamp, status, load_pct,
+        speed_rpm, temperature_c, vibration_mm_s, degradation_level
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
+    """
+
     def __init__(self, db_name: str = "sensors.db"):
         # Define absolute path based on project root
         # This ensures it works regardless of where the script is executed
@@ -39,8 +64,16 @@ class DatabaseHandler:
         """Establishes connection to the SQLite database."""
         try:
             # check_same_thread=False is necessary if Streamlit runs on another thread
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            # cached_statements above the default 128 keeps hot statements
+            # prepared even when several cursors interleave queries
+            self.connection = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=512
+            )
             self.cursor = self.connection.cursor()
+            # WAL lets dashboard readers proceed while the simulator
+            # writes; synchronous=NORMAL drops the per-commit full fsync
+            self.cursor.execute("PRAGMA journal_mode=WAL;")
+            self.cursor.execute("PRAGMA synchronous=NORMAL;")
             logger.info(f"Connected to database at {self.db_path}")
             
             # Ensure the table schema exists upon connection
@@ -53,7 +86,7 @@ class DatabaseHandler:
         """Internal method to initialize the schema."""
         create_table_query = """
         CREATE TABLE IF NOT EXISTS telemetry (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             motor_id TEXT NOT NULL,
             timestamp DATETIME NOT NULL,
             status TEXT NOT NULL,
@@ -64,11 +97,23 @@ class DatabaseHandler:
             degradation_level REAL
         );
         """
+        # Without secondary indexes every dashboard read full-scans the
+        # table. The composite index covers per-motor filters and the
+        # latest-per-motor window; the timestamp index serves the global
+        # ORDER BY timestamp DESC LIMIT reads.
+        create_index_queries = [
+            """CREATE INDEX IF NOT EXISTS idx_telemetry_motor_ts
+               ON telemetry(motor_id, timestamp DESC, id DESC);""",
+            """CREATE INDEX IF NOT EXISTS idx_telemetry_ts
+               ON telemetry(timestamp DESC);"""
+        ]
         if self.cursor:
             self.cursor.execute(create_table_query)
+            for create_index_query in create_index_queries:
+                self.cursor.execute(create_index_query)
             self.connection.commit()
 
-    def save_reading(self, data: Dict[str, Any]):
+    def save_reading(self, data: Any):
         """
         Inserts a single dictionary reading into the database.
         Maps dictionary keys to SQL columns explicitly to avoid ordering errors.
@@ -76,39 +121,47 @@ class DatabaseHandler:
         if not self.connection:
             self.connect()
 
-        insert_query = """
-        INSERT INTO telemetry (
-            motor_id, timestamp, status, load_pct, 
-            speed_rpm, temperature_c, vibration_mm_s, degradation_level
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-        """
-
         # Transform Dict to Tuple in EXACT column order
         # This fixes type incompatibility issues with sqlite3
-        params = (
-            data.get("motor_id"),
-            data.get("timestamp"),
-            data.get("status"),
-            data.get("load_pct"),
-            data.get("speed_rpm"),
-            data.get("temperature_c"),
-            data.get("vibration_mm_s"),
-            data.get("degradation_level")
-        )
+        params = _as_row(data)
 
         try:
-            self.cursor.execute(insert_query, params)
+            self.cursor.execute(self._INSERT_SQL, params)
             self.connection.commit()
             # logger.debug(f"Saved reading for {data.get('motor_id')}") # Verbose logging
         except sqlite3.Error as e:
             logger.error(f"Error inserting data: {e}")
 
+    def save_readings_bulk(self, rows: List[Any]):
+        """
+        Inserts a batch of readings in one executemany + single commit.
+        Each commit fsyncs the journal, so batching amortizes the disk
+        sync across the whole batch instead of paying it per sample.
+        """
+        if not rows:
+            return
+        if not self.connection:
+            self.connect()
+
+        try:
+            self.cursor.executemany(self._INSERT_SQL, map(_as_row, rows))
+            self.connection.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error inserting batch of {len(rows)} readings: {e}")
+
     def get_recent_readings(self, motor_id: Optional[str] = None, limit: int = 50) -> List[tuple]:
         """Fetch historical data for the frontend."""
         if not self.cursor:
             self.connect()
 
-        select_query = "SELECT * FROM telemetry"
+        # Explicit column list (no surrogate id): callers never consume the
+        # id, and skipping it lets the covering indexes answer the query
+        # without a heap lookup per row
+        select_query = (
+            "SELECT motor_id, timestamp, status, load_pct, "
+            "speed_rpm, temperature_c, vibration_mm_s, degradation_level "
+            "FROM telemetry"
+        )
         params = []
         
         if motor_id:
@@ -126,6 +179,41 @@ class DatabaseHandler:
             logger.error(f"Error retrieving data: {e}")
             return []
 
+    def iter_recent_readings(self, motor_id: Optional[str] = None,
+                             limit: int = 50, chunk: int = 256):
+        """
+        Streaming variant of get_recent_readings: yields rows in
+        fetchmany(chunk) batches so peak memory stays O(chunk) rather than
+        O(limit), and consumers can apply back-pressure on large windows.
+        """
+        if not self.cursor:
+            self.connect()
+
+        select_query = (
+            "SELECT motor_id, timestamp, status, load_pct, "
+            "speed_rpm, temperature_c, vibration_mm_s, degradation_level "
+            "FROM telemetry"
+        )
+        params = []
+
+        if motor_id:
+            select_query += " WHERE motor_id = ?"
+            params.append(motor_id)
+
+        select_query += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        try:
+            self.cursor.arraysize = chunk
+            self.cursor.execute(select_query, params)
+            while True:
+                rows = self.cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            logger.error(f"Error streaming data: {e}")
+
     def close(self):
         if self.connection:
             self.connection.close()
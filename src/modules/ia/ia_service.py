@@ -9,6 +9,18 @@ from time import time
 # --- Logging Configuration ---
 logger = logging.getLogger("TwinSight-AIService")
 
+# Precompiled once: reasoning models wrap their scratchpad in <think> tags
+# that must be stripped from every analysis
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+
+
+def _strip_think_tags(text: str) -> str:
+    # The C-level substring check skips the regex engine entirely for the
+    # common case of responses without think tags
+    if '<think>' in text:
+        return _THINK_RE.sub('', text).strip()
+    return text.strip()
+
 class AIService:
     def __init__(self):
         env = get_environment()
@@ -35,10 +47,14 @@ class AIService:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             raise
 
-    def generate_analysis(self, context: str, prompt: str) -> str:
+    def generate_analysis(self, context: str, prompt: str, on_delta=None) -> str:
         """
         Generates a textual analysis based on technical context (DB Data).
         Used to explain the data retrieved from the database to the user.
+
+        The completion is streamed: when on_delta is provided it receives
+        each content chunk as it arrives, so the UI can show tokens
+        immediately instead of blocking until the full generation ends.
         """
         system_prompt = (
             "You are a Senior Industrial Engineer specializing in predictive maintenance. "
@@ -55,12 +71,23 @@ class AIService:
                     {"role": "user", "content": f"Context (Database Data): {context}\n\nTask (User Question): {prompt}"}
                 ],
                 max_tokens=4096,
-                temperature=0.3
+                temperature=0.3,
+                stream=True
             )
+
+            parts = []
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                if delta:
+                    parts.append(delta)
+                    if on_delta:
+                        on_delta(delta)
+
             fim = time()
             print(f"Analysis generated in {fim - inicio:.2f} seconds. | model={self.model_for_text}")
-            analysis_raw = response.choices[0].message.content.strip()
-            clean_content = re.sub(r'<think>.*?</think>', '', analysis_raw, flags=re.DOTALL).strip()
+            clean_content = _strip_think_tags(''.join(parts))
             logger.debug(f"Generated Analysis: {clean_content}")
             return clean_content
         
@@ -1,9 +1,10 @@
-import random
 import time
+import zlib
 import logging
+import numpy as np
 from datetime import datetime
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, Dict, NamedTuple, Optional
 
 # --- Logging Configuration ---
 #logging.basicConfig(
@@ -13,6 +14,24 @@ from typing import Dict, Any
 #)
 logger = logging.getLogger("TwinSight-MotorSim")
 
+
+class Telemetry(NamedTuple):
+    """
+    One telemetry packet. A NamedTuple has a fixed layout (no per-packet
+    dict allocation or key hashing in the hot polling loop) and, being a
+    plain tuple in field order matching the telemetry table's insert
+    columns, feeds sqlite3 executemany without any transform.
+    """
+    motor_id: str
+    timestamp: str
+    status: str
+    load_pct: float
+    speed_rpm: int
+    temperature_c: float
+    vibration_mm_s: float
+    degradation_level: float
+
+
 class MotorSensor(ABC):
     """
     Abstract Base Class defining the contract for any motor sensor system.
@@ -37,7 +56,7 @@ class MotorSensor(ABC):
         pass
 
     @abstractmethod
-    def get_telemetry(self) -> Dict[str, Any]:
+    def get_telemetry(self) -> "Telemetry":
         """Returns the current sensor readings."""
         pass
 
@@ -73,6 +92,9 @@ class MotorSimulator(MotorSensor):
     SPEED_NOISE_RANGE = 50          # +/- RPM fluctuation
     MAX_LOAD_SLIP_RPM = 20         # Max RPM drop due to load
 
+    # RNG batching: cycles drawn per buffer refill
+    NOISE_BUFFER_SIZE = 1024
+
     def __init__(self, motor_id: str,  base_rpm: int = 1800, base_temperature: float = 45.0, 
                  base_vibration: float = 0.5, temp_factor: float = 0.02, vibration_factor: float = 0.01,
                  degradation_rate: float = 0.0005, initial_load: float = 0.8):
@@ -91,9 +113,34 @@ class MotorSimulator(MotorSensor):
         
         # State
         self.current_load = initial_load  # 1.0 = Full Load, 0.0 = Idle
-        self._degradation_accumulated = 0.0 
+        self._degradation_accumulated = 0.0
         self._cycle_count = 0
 
+        # RNG: one PCG64 generator per motor (seeded from the ID so runs
+        # are reproducible), refilled in batches to amortize call overhead
+        self._rng = np.random.default_rng(zlib.crc32(motor_id.encode()))
+        self._noise_buf = None
+        self._noise_idx = 0
+
+    def _next_noise(self):
+        """
+        Returns (speed, thermal, mech) noise for one cycle. Noise is
+        pre-drawn NOISE_BUFFER_SIZE cycles at a time: vectorized PCG64
+        draws cost far less per sample than a Python-level random call
+        per field per cycle.
+        """
+        if self._noise_buf is None or self._noise_idx >= self.NOISE_BUFFER_SIZE:
+            n = self.NOISE_BUFFER_SIZE
+            self._noise_buf = np.column_stack((
+                self._rng.integers(-self.SPEED_NOISE_RANGE, self.SPEED_NOISE_RANGE + 1, n),
+                self._rng.uniform(self.THERMAL_NOISE_MIN, self.THERMAL_NOISE_MAX, n),
+                self._rng.uniform(self.MECH_NOISE_MIN, self.MECH_NOISE_MAX, n)
+            ))
+            self._noise_idx = 0
+        row = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        return row
+
     def start(self) -> None:
         self._is_running = True
         self.speed = self._base_rpm
@@ -120,11 +167,11 @@ class MotorSimulator(MotorSensor):
             return
 
         self._cycle_count += 1
+        speed_noise, thermal_noise, mech_noise = self._next_noise()
 
         # 1. Physics: Load and Speed Fluctuation
         # Load slightly reduces actual speed (slip)
-        load_drag = self.current_load * self.MAX_LOAD_SLIP_RPM 
-        speed_noise = random.randint(-self.SPEED_NOISE_RANGE, self.SPEED_NOISE_RANGE)
+        load_drag = self.current_load * self.MAX_LOAD_SLIP_RPM
         target_speed = (self._base_rpm - load_drag) + speed_noise
         
         # 2. Physics: Calculate Degradation Multiplier
@@ -140,16 +187,14 @@ class MotorSimulator(MotorSensor):
         # Heat = Base + (RPM * Factor * Load) + (Wear * Factor) + Noise - Cooling
         heat_from_rpm = (self.speed / self._base_rpm) * self._temp_factor * self.HEAT_RPM_MULTIPLIER * self.current_load
         heat_from_wear = self._degradation_accumulated * self.HEAT_WEAR_MULTIPLIER
-        thermal_noise = random.uniform(self.THERMAL_NOISE_MIN, self.THERMAL_NOISE_MAX)
-        
+
         self.temperature += heat_from_rpm + heat_from_wear + thermal_noise - self.PASSIVE_COOLING_RATE
 
         # 4. Physics: Update Vibration
         # Vibration = Base + (RPM * Factor * Load) + (Wear * Factor) + Noise
         vibration_from_rpm = (self.speed / self._base_rpm) * self._vibration_factor * self.current_load
         vibration_from_wear = self._degradation_accumulated * self.VIBRATION_WEAR_MULTIPLIER
-        mech_noise = random.uniform(self.MECH_NOISE_MIN, self.MECH_NOISE_MAX)
-        
+
         self.vibration = self._base_vibration + vibration_from_rpm + vibration_from_wear + mech_noise
 
         self.speed = max(0, target_speed)
@@ -184,21 +229,26 @@ class MotorSimulator(MotorSensor):
         self.vibration = self._base_vibration
         logger.info(f"Maintenance complete. Motor {self.motor_id} restored to factory condition.")
 
-    def get_telemetry(self) -> Dict[str, Any]:
-        """Returns the current state packet."""
+    def get_telemetry(self, ts: Optional[str] = None) -> Telemetry:
+        """
+        Returns the current state packet.
+        All motors polled in the same tick share the same simulation time,
+        so the driver can pass one precomputed ISO timestamp instead of
+        paying a datetime.now() + isoformat() per motor.
+        """
 
         self.simulate_cycle()
-        
-        return {
-            "motor_id": self.motor_id,
-            "timestamp": datetime.now().isoformat(),
-            "status": "RUNNING" if self._is_running else "STOPPED",
-            "load_pct": round(self.current_load * 100, 1), # Added to telemetry
-            "speed_rpm": int(self.speed),
-            "temperature_c": round(self.temperature, 2),
-            "vibration_mm_s": round(self.vibration, 3),
-            "degradation_level": round(self._degradation_accumulated, 4)
-        }
+
+        return Telemetry(
+            motor_id=self.motor_id,
+            timestamp=ts if ts is not None else datetime.now().isoformat(),
+            status="RUNNING" if self._is_running else "STOPPED",
+            load_pct=round(self.current_load * 100, 1),
+            speed_rpm=int(self.speed),
+            temperature_c=round(self.temperature, 2),
+            vibration_mm_s=round(self.vibration, 3),
+            degradation_level=round(self._degradation_accumulated, 4)
+        )
 
 # --- Unit Test ---
 if __name__ == "__main__":
@@ -1,34 +1,64 @@
 import os
-import sys
-from dotenv import load_dotenv
+import functools
+from dotenv import load_dotenv, find_dotenv, set_key
 import logging
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 logger = logging.getLogger("TwinSight-Orchestrator")
 
-def get_environment() -> dict:
+# Loaded configuration, reused across calls until explicitly invalidated
+_config_cache = None
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_env() -> str:
+    """
+    Finds the .env file once. find_dotenv stats every parent directory of
+    the working directory, which is wasted filesystem work when repeated
+    on every config read; the location doesn't change within a run.
     """
-    Loads environment variables from a .env file and returns them as a dictionary.
-    Expected variables: API_URL, API_KEY, MODEL_FOR_TEXT, MODEL_FOR_JSON
+    return find_dotenv()
+
+def load_config(reload: bool = False) -> dict:
+    """
+    Loads the full TwinSight configuration from the .env file.
+    Unlike get_environment, missing files are tolerated so the interface
+    can start with empty credentials and let the user fill them in.
+
+    The result is cached after the first read; pass reload=True (or call
+    update_env_variable, which invalidates the cache) to pick up changes.
     """
-    
-    loaded = load_dotenv()
-    
-    if not loaded:
-        logger.error("File: .env not found or empty. Please ensure it exists and contains the necessary variables.")
-        return {}
-    
-    api_url = os.getenv("API_URL")
-    secret_key = os.getenv("API_KEY")
-    model_text = os.getenv("MODEL_FOR_TEXT")
-    model_json = os.getenv("MODEL_FOR_JSON")
-
-    return {
-        "API_URL": api_url,
-        "API_KEY": secret_key,
-        "MODEL_FOR_TEXT": model_text,
-        "MODEL_FOR_JSON": model_json
+    global _config_cache
+    if _config_cache is not None and not reload:
+        return _config_cache
+
+    env_path = _locate_env()
+    if env_path:
+        load_dotenv(env_path, override=reload)
+
+    _config_cache = {
+        "API_URL": os.getenv("API_URL"),
+        "API_KEY": os.getenv("API_KEY"),
+        "MODEL_FOR_TEXT": os.getenv("MODEL_FOR_TEXT"),
+        "MODEL_FOR_JSON": os.getenv("MODEL_FOR_JSON"),
+        "VALIDATION_MODEL": os.getenv("VALIDATION_MODEL")
     }
-    
+    return _config_cache
+
+def update_env_variable(key: str, value: str) -> None:
+    """Persists a single variable back to the .env file (creates it if missing)."""
+    global _config_cache
+    env_path = _locate_env()
+    if not env_path:
+        env_path = os.path.join(os.getcwd(), ".env")
+        # The file is about to exist; let the next lookup find it
+        _locate_env.cache_clear()
+
+    set_key(env_path, key, value)
+    os.environ[key] = value
+    _config_cache = None
+
+# Back-compat: older callers load the configuration under this name
+get_environment = load_config
+
 if __name__ == "__main__":
     get_environment()
\ No newline at end of file